@@ -35,10 +35,28 @@ from litellm.integrations.custom_logger import CustomLogger # pyright: ignore[re
 from litellm.proxy.proxy_server import UserAPIKeyAuth, DualCache  # pyright: ignore[reportMissingImports]
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _content_to_text(content) -> str:
+    """
+    Flatten a message 'content' value to plain text.
+
+    Multimodal content is a list of blocks; only the 'text' blocks are kept.
+    Non-text blocks (e.g. images) in a combined 'system' message are dropped.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join([
+            block.get("text", "")
+            for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        ])
+    if content is None:
+        return ""
+    return str(content)
+
 # pylint: disable=unused-argument
 class CombineSystemMessagesPlugin(CustomLogger):
     """
@@ -46,14 +64,7 @@ class CombineSystemMessagesPlugin(CustomLogger):
     in the request body.
     """
 
-    def __init__(self):
-        """
-        Initialize the CombineSystemMessagesPlugin.
-
-        Sets the plugin name for identification.
-        """
-        super().__init__()
-        self.name = "combine_system_messages_plugin"
+    name = "combine_system_messages_plugin"
 
     async def async_pre_call_hook(
             self,
@@ -84,26 +95,43 @@ class CombineSystemMessagesPlugin(CustomLogger):
         Returns:
             dict: The modified data with combined 'system' messages
         """
-        try:
-            messages = data.get("messages")
-
-            if not isinstance(messages, list):
-                return data
-
-            system_messages = [msg for msg in messages if msg.get("role") == "system"]
-
-            if len(system_messages) > 1:
-                # Combine all system messages into the first system message
-                combined_content = "\n".join(msg.get("content", "") for msg in system_messages)
-                system_messages[0]["content"] = combined_content
-
-                # Remove the additional system messages
-                data["messages"] = [msg for msg in messages if msg not in system_messages[1:]]
+        messages = data.get("messages")
 
+        if not isinstance(messages, list):
             return data
 
-        except Exception as e:
-            logger.error(f"Error processing messages: {e}")
+        # Fast path: nothing to combine with zero or one 'system' message.
+        system_count = 0
+        for msg in messages:
+            if type(msg) is dict and "role" in msg and msg["role"] == "system":
+                system_count += 1
+                if system_count > 1:
+                    break
+        if system_count < 2:
             return data
 
+        # Single pass: keep the first 'system' message in place, drop the others
+        # and collect every 'system' content for one join at the end.
+        first_sys_idx = -1
+        parts = []
+        out = []
+        parts_append = parts.append
+        out_append = out.append
+        for msg in messages:
+            if type(msg) is dict and "role" in msg and msg["role"] == "system":
+                part = _content_to_text(msg.get("content", ""))
+                if part:
+                    parts_append(part)
+                if first_sys_idx < 0:
+                    first_sys_idx = len(out)
+                    out_append(msg)
+            else:
+                out_append(msg)
+
+        # Copy instead of mutating the caller's dict
+        out[first_sys_idx] = {**out[first_sys_idx], "content": "\n".join(parts)}
+        data["messages"] = out
+
+        return data
+
 proxy_handler_instance = CombineSystemMessagesPlugin()
\ No newline at end of file
@@ -3,24 +3,35 @@ import litellm
 import json
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# orjson is optional; fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder handles
+            return json.dumps(obj, indent=2, default=str)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, default=str)
+
 logger = logging.getLogger(__name__)
 
 class PreAPICallLogger(CustomLogger):
     """
     Custom logger to log the pre-api-call messages.
     """
-    def __init__(self):
-        super().__init__()
 
     def log_pre_api_call(self, model, messages, kwargs):
-        logger.info(f"Pre-API Call for model: {model}")
-        try:
-            pretty_messages = json.dumps(messages, indent=2)
-            logger.info(f"Messages: {pretty_messages}")
-        except TypeError:
-            logger.info(f"Messages (could not serialize to JSON): {messages}")
+        # Skip serializing the whole chat history when INFO is not logged
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("Pre-API Call for model: %s", model)
+        logger.info("Messages:\n%s", _dumps(messages))
 
 
 # Instantiate the custom logger
@@ -0,0 +1,178 @@
+"""
+Message Normalizer Plugin for LiteLLM
+
+This plugin combines the behaviour of the Remove Name Plugin and the
+Combine System Messages Plugin into a single pre-call hook. It removes the
+'name' attribute from all messages and combines multiple 'system' messages
+into the first 'system' message before they are forwarded to LLM models.
+
+Deployments that enable both plugins walk the message list twice per request.
+This plugin performs both transformations in one pass over the messages and
+one hook invocation, so it should be configured instead of the two separate
+plugins, not in addition to them.
+
+Compatibility Issues Addressed:
+- LLM providers that don't support the 'name' field
+- LLM providers that don't support multiple 'system' messages
+- API error prevention when either is unexpected
+
+Usage:
+To use this plugin, you need to add it to your LiteLLM configuration file (e.g., `litellm_config.yaml`).
+- Add this plugin to your LiteLLM configuration
+  litellm_config.yaml
+  '''
+    ...
+    litellm_settings:
+      callbacks: ["message_normalizer_plugin.proxy_handler_instance"]
+    ...
+  '''
+- The plugin will automatically process all messages
+- No manual intervention required
+
+Subclasses can add further per-message rewrites, applied in the same pass, by
+setting `extra_transforms` to a tuple of (predicate, transform) pairs.
+
+"""
+from typing import Literal
+from litellm.integrations.custom_logger import CustomLogger # pyright: ignore[reportMissingImports]
+from litellm.proxy.proxy_server import UserAPIKeyAuth, DualCache  # pyright: ignore[reportMissingImports]
+
+
+def _content_to_text(content) -> str:
+    """
+    Flatten a message 'content' value to plain text.
+
+    Multimodal content is a list of blocks; only the 'text' blocks are kept.
+    Non-text blocks (e.g. images) in a combined 'system' message are dropped.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join([
+            block.get("text", "")
+            for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        ])
+    if content is None:
+        return ""
+    return str(content)
+
+
+def _without_name(message: dict) -> dict:
+    """
+    Return a copy of the message without its 'name' field.
+    """
+    stripped = message.copy()
+    del stripped["name"]
+    return stripped
+
+# pylint: disable=unused-argument
+class MessageNormalizerPlugin(CustomLogger):
+    """
+    A LiteLLM plugin to remove the 'name' parameter from all messages and to
+    combine multiple 'system' messages into the first 'system' message.
+
+    `extra_transforms` holds (predicate, transform) pairs applied in order to every
+    message dict after 'name' removal. A transform returns the replacement message
+    and must not mutate its argument.
+    """
+
+    name = "message_normalizer_plugin"
+    extra_transforms = ()
+
+    async def async_pre_call_hook(
+            self,
+            user_api_key_dict: UserAPIKeyAuth,
+            cache: DualCache,
+            data: dict,
+            call_type: Literal[
+                "completion",
+                "text_completion",
+                "embeddings",
+                "image_generation",
+                "moderation",
+                "audio_transcription",
+            ]
+    ) -> dict:
+        """
+        Remove 'name' attributes and combine 'system' messages before sending to LLM.
+
+        Both transformations are applied in a single pass over the messages.
+
+        Args:
+            user_api_key_dict (UserAPIKeyAuth): User API key authentication info
+            cache (DualCache): Cache instance
+            data (dict): The request payload data containing messages
+            call_type (Literal): Type of API call being made
+
+        Returns:
+            dict: The modified data without 'name' fields and with combined 'system' messages
+        """
+        messages = data.get("messages")
+
+        if not isinstance(messages, list):
+            return data
+
+        extra_transforms = self.extra_transforms
+
+        # Fast path: stop at the first message that needs a rewrite
+        start = -1
+        first_sys_idx = -1
+        for index, msg in enumerate(messages):
+            if type(msg) is not dict:
+                continue
+            if "name" in msg:
+                start = index
+                break
+            if extra_transforms:
+                for predicate, _ in extra_transforms:
+                    if predicate(msg):
+                        start = index
+                        break
+                if start >= 0:
+                    break
+            if "role" in msg and msg["role"] == "system":
+                if first_sys_idx >= 0:
+                    start = index
+                    break
+                first_sys_idx = index
+        if start < 0:
+            return data
+
+        # Messages before `start` need no rewrite and hold at most one 'system'
+        out = messages[:start]
+        parts = []
+        merge = False
+        parts_append = parts.append
+        out_append = out.append
+        if first_sys_idx >= 0:
+            part = _content_to_text(out[first_sys_idx].get("content", ""))
+            if part:
+                parts_append(part)
+        for index in range(start, len(messages)):
+            msg = messages[index]
+            if type(msg) is dict:
+                if "name" in msg:
+                    msg = _without_name(msg)
+                if extra_transforms:
+                    for predicate, transform in extra_transforms:
+                        if predicate(msg):
+                            msg = transform(msg)
+                if "role" in msg and msg["role"] == "system":
+                    part = _content_to_text(msg.get("content", ""))
+                    if part:
+                        parts_append(part)
+                    if first_sys_idx >= 0:
+                        merge = True
+                        continue
+                    first_sys_idx = len(out)
+            out_append(msg)
+
+        if merge:
+            out[first_sys_idx] = {**out[first_sys_idx], "content": "\n".join(parts)}
+
+        data["messages"] = out
+
+        return data
+
+proxy_handler_instance = MessageNormalizerPlugin()
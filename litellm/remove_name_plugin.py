@@ -34,6 +34,15 @@ from typing import Literal
 from litellm.integrations.custom_logger import CustomLogger # pyright: ignore[reportMissingImports]
 from litellm.proxy.proxy_server import UserAPIKeyAuth, DualCache  # pyright: ignore[reportMissingImports]
 
+
+def _without_name(message: dict) -> dict:
+    """
+    Return a copy of the message without its 'name' field.
+    """
+    stripped = message.copy()
+    del stripped["name"]
+    return stripped
+
 # pylint: disable=unused-argument
 class RemoveNamePlugin(CustomLogger):
     """
@@ -41,14 +50,7 @@ class RemoveNamePlugin(CustomLogger):
     in the request body.
     """
     
-    def __init__(self):
-        """
-        Initialize the RemoveNamePlugin.
-        
-        Sets the plugin name for identification.
-        """
-        super().__init__()
-        self.name = "remove_name_plugin"
+    name = "remove_name_plugin"
     
     async def async_pre_call_hook(self, 
             user_api_key_dict: UserAPIKeyAuth, 
@@ -78,21 +80,29 @@ class RemoveNamePlugin(CustomLogger):
         Returns:
             dict: The modified data with 'name' field removed from user messages
         """
-        try:
-            messages = data.get("messages")
-            
-            if not isinstance(messages, list):
-                return data
-            
-            modified_count = 0
-            for message in messages:
-                if isinstance(message, dict) and "name" in message:
-                    message.pop("name", None)
-                    modified_count += 1
-            
+        messages = data.get("messages")
+        
+        if not isinstance(messages, list):
             return data
-            
-        except Exception as e:
-            return data   
+        
+        # Fast path: no message carries a 'name' field.
+        has_name = False
+        for message in messages:
+            if type(message) is dict and "name" in message:
+                has_name = True
+                break
+        if not has_name:
+            return data
+
+        # Build copies without 'name' rather than mutating the caller's dicts;
+        # messages without the field keep their original reference.
+        data["messages"] = [
+            _without_name(message)
+            if type(message) is dict and "name" in message
+            else message
+            for message in messages
+        ]
+        
+        return data
 
 proxy_handler_instance = RemoveNamePlugin()